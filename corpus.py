@@ -0,0 +1,129 @@
+import random
+from pathlib import Path
+from typing import TypedDict
+
+from fitz import Pixmap, Point, Rect, csCMYK
+from fitz import open as fitzopen
+
+
+class CorpusSpec(TypedDict, total=True):
+    """
+    Parameters of a single synthetic PDF.
+    """
+
+    pages: int
+    vector_ops: int
+    image_size: int
+
+
+A4: tuple[float, float] = (595.0, 842.0)
+"""
+A4 page size in PDF points.
+"""
+
+
+def _random_cmyk(rng: random.Random) -> tuple[float, float, float, float]:
+    """
+    Random CMYK colour with at most half coverage of black.
+    """
+    return (rng.random(), rng.random(), rng.random(), rng.random() * 0.5)
+
+
+def generate_pdf(
+    output_path: Path,
+    pages: int = 1,
+    vector_ops: int = 0,
+    image_size: int = 0,
+    page_size: tuple[float, float] = A4,
+    seed: int = 0,
+) -> Path:
+    """
+    Build a parameterised synthetic PDF with PyMuPDF.
+
+    Parameters
+    ----------
+    output_path : pathlib.Path
+        Destination for the PDF.
+    pages : int, default 1
+        Number of pages.
+    vector_ops : int, default 0
+        Number of filled and stroked vector shapes drawn on every page.
+    image_size : int, default 0
+        Side length in pixels of a random CMYK image embedded on every page,
+        0 for no image.
+    page_size : tuple[float, float], default A4
+        Page width and height in points.
+    seed : int, default 0
+        Seed for the shape and image contents, so a spec always yields the same file.
+    """
+    if pages < 1:
+        raise ValueError("A PDF needs at least one page")
+
+    rng = random.Random(seed)
+    width, height = page_size
+    doc = fitzopen()
+
+    for _ in range(pages):
+        page = doc.new_page(width=width, height=height)
+
+        if image_size > 0:
+            samples = rng.randbytes(image_size * image_size * 4)
+            pix = Pixmap(csCMYK, image_size, image_size, samples, False)
+            page.insert_image(
+                Rect(0, 0, width, height), pixmap=pix, keep_proportion=False
+            )
+            del pix
+
+        shape = page.new_shape()
+        for op in range(vector_ops):
+            p1 = Point(rng.uniform(0, width), rng.uniform(0, height))
+            p2 = Point(rng.uniform(0, width), rng.uniform(0, height))
+            match op % 3:
+                case 0:
+                    shape.draw_rect(Rect(p1, p2).normalize())
+                case 1:
+                    shape.draw_circle(p1, rng.uniform(1, width / 8))
+                case _:
+                    c1 = Point(rng.uniform(0, width), rng.uniform(0, height))
+                    c2 = Point(rng.uniform(0, width), rng.uniform(0, height))
+                    shape.draw_bezier(p1, c1, c2, p2)
+            shape.finish(
+                color=_random_cmyk(rng),
+                fill=_random_cmyk(rng) if op % 3 != 2 else None,
+                width=rng.uniform(0.25, 2),
+            )
+        shape.commit()
+
+    doc.save(str(output_path), garbage=3, deflate=True)
+    doc.close()
+    return output_path
+
+
+def generate_corpus(
+    directory: Path, specs: list[CorpusSpec], seed: int = 0
+) -> list[Path]:
+    """
+    Generate one PDF per spec into a directory, skipping files which already exist.
+
+    File names encode the spec and the seed, e.g. ``p4_v1000_i512_s0.pdf``, so a
+    file generated with another seed is never mistaken for a cached one.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+
+    for spec in specs:
+        path = directory / (
+            f"p{spec['pages']}_v{spec['vector_ops']}_i{spec['image_size']}_s{seed}.pdf"
+        )
+        if not path.is_file():
+            generate_pdf(
+                path,
+                pages=spec["pages"],
+                vector_ops=spec["vector_ops"],
+                image_size=spec["image_size"],
+                seed=seed,
+            )
+        paths.append(path)
+
+    return paths
+
@@ -1,13 +1,13 @@
-from gc import collect
 from pathlib import Path
-from time import time_ns
 from typing import cast
 
-from memory_profiler import memory_usage
 from numpy import array, float64, ndarray
 
 from methods import convert_pdf_to_cmyk_tiff_custom, convert_pdf_to_cmyk_tiff_gs
-from plotting import Graph, Plot, PlotType, graph
+from plotting import Graph, Plot, PlotType, cached_graph
+from runner import TrialResult, run_isolated
+from scheduling import CacheMode, TrialOrder, pin_cpus, schedule
+from verify import compare_tiffs
 
 CWD: Path = Path(__file__).parent.resolve()
 GPATH: Path = CWD / "examples"
@@ -17,63 +17,67 @@ PATTERNS.mkdir(parents=True, exist_ok=True)
 IMAGES = CWD / "images"
 IMAGES.mkdir(parents=True, exist_ok=True)
 RUNS = 60
+MAX_ABS_ERROR = 8
+WARMUP = 3
+ORDER = TrialOrder.INTERLEAVED
+CACHE = CacheMode.HOT
+CPUS: set[int] | None = None
+BATCH_SIZE = 10
+WORKERS = 1
+SEED: int | None = None
+
+BACKENDS = {
+    "CUSTOM": convert_pdf_to_cmyk_tiff_custom,
+    "GS": convert_pdf_to_cmyk_tiff_gs,
+}
 
-
-pdfs = [_ for _ in PATTERNS.glob("*.pdf")]
 xaxis = array([i for i in range(RUNS)], order="C", dtype=float64)
 
-for pdf in pdfs:
-    custom_times = ndarray(RUNS, order="C", dtype=float64)
-    custom_memory_max = ndarray(RUNS, order="C", dtype=float64)
-    # custom_memory_std = ndarray(RUNS, order="C", dtype=float64)
-
-    gs_times = ndarray(RUNS, order="C", dtype=float64)
-    gs_memory_max = ndarray(RUNS, order="C", dtype=float64)
-    # gs_memory_std = ndarray(RUNS, order="C", dtype=float64)
-
-    for index in range(RUNS):
-        print(f"Processing CUSTOM {pdf.name} @ {pdf} - Run {index + 1}")
-        now = time_ns()
-
-        mems = array(
-            memory_usage(
-                (
-                    convert_pdf_to_cmyk_tiff_custom,
-                    (pdf, IMAGES / f"{pdf.name}_custom.png"),
-                    {},
-                ),
-                interval=0.25,
-                timeout=5,
-            ),
-            dtype=float64,
-        )
 
-        elapsed = time_ns() - now
-        custom_times[index] = elapsed / 1000000
-        custom_memory_max[index] = mems.max()
-        collect()
-
-    for index in range(RUNS):
-        print(f"Processing GS {pdf.name} @ {pdf} - Run {index + 1}")
-        now = time_ns()
-
-        mems = array(
-            memory_usage(
-                (
-                    convert_pdf_to_cmyk_tiff_gs,
-                    (pdf, IMAGES / f"{pdf.name}_gs.png"),
-                    {},
-                ),
-                interval=0.25,
-                timeout=5,
-            ),
-            dtype=float64,
+def verify_pdf(pdf: Path) -> None:
+    """
+    Compare the GS and CUSTOM outputs of a PDF and print the verdict.
+    """
+    try:
+        report = compare_tiffs(
+            IMAGES / f"{pdf.name}_gs.png",
+            IMAGES / f"{pdf.name}_custom.png",
+            max_abs_error=MAX_ABS_ERROR,
+        )
+    except (OSError, ValueError) as e:
+        # Missing or unreadable outputs, or outputs which cannot be compared
+        print(f"Verify {pdf.name}: ERROR - {e}")
+        return
+
+    print(
+        f"Verify {pdf.name}: {'PASS' if report['passed'] else 'FAIL'}"
+        f" - {report['differing_pixels']} differing pixels"
+        f" over {report['rows_compared']} rows"
+    )
+    for band, stats in report["channels"].items():
+        print(
+            f"  {band}: max abs error {stats['max_abs_error']},"
+            f" {stats['differing']} differing, PSNR {stats['psnr']:.2f} dB"
         )
 
-        elapsed = time_ns() - now
-        gs_times[index] = elapsed / 1000000
-        gs_memory_max[index] = mems.max()
-        collect()
+
+def report_pdf(pdf: Path, results: list[TrialResult]) -> None:
+    """
+    Verify the backend outputs of a PDF and graph its measured trials.
+    """
+    times = {name: ndarray(RUNS, order="C", dtype=float64) for name in BACKENDS}
+    memory_max = {name: ndarray(RUNS, order="C", dtype=float64) for name in BACKENDS}
+
+    for result in results:
+        if result["warmup"]:
+            continue
+        times[result["backend"]][result["index"]] = result["time_ms"]
+        memory_max[result["backend"]][result["index"]] = result["memory_max"]
+
+    custom_times, gs_times = times["CUSTOM"], times["GS"]
+    custom_memory_max, gs_memory_max = memory_max["CUSTOM"], memory_max["GS"]
+
+    verify_pdf(pdf)
 
     custom_times_plot = cast(
         Plot,
@@ -153,5 +157,23 @@ for pdf in pdfs:
         },
     )
 
-    graph(times_graph, GPATH / f"{pdf.name}_times.png")
-    graph(memory_graph, GPATH / f"{pdf.name}_memory.png")
+    cached_graph(times_graph, GPATH / f"{pdf.name}_times.png")
+    cached_graph(memory_graph, GPATH / f"{pdf.name}_memory.png")
+
+
+if __name__ == "__main__":
+    if CPUS is not None:
+        pin_cpus(CPUS)
+
+    pdfs = [_ for _ in PATTERNS.glob("*.pdf")]
+    results = run_isolated(
+        {pdf: schedule(list(BACKENDS), RUNS, ORDER, WARMUP, SEED) for pdf in pdfs},
+        BACKENDS,
+        IMAGES,
+        CACHE,
+        batch_size=BATCH_SIZE,
+        workers=WORKERS,
+    )
+
+    for pdf in pdfs:
+        report_pdf(pdf, results[pdf])
@@ -1,10 +1,84 @@
+import functools
 import shutil
+from io import BytesIO
 from pathlib import Path
-from subprocess import PIPE, CalledProcessError, run
+from subprocess import PIPE, CalledProcessError, Popen, run
+from threading import Thread
+from typing import BinaryIO, Callable, TypedDict
 
-from fitz import Matrix, csCMYK
+from fitz import Matrix, csCMYK, csGRAY, csRGB
 from fitz import open as fitzopen
-from PIL import Image
+from PIL import Image, ImageCms
+
+
+@functools.lru_cache(maxsize=16)
+def _read_icc_profile(icc_profile_path: Path, mtime_ns: int) -> bytes:
+    """
+    Read an ICC profile from disk. Cached per path and modification time.
+    """
+    return icc_profile_path.read_bytes()
+
+
+def load_icc_profile(icc_profile_path: Path) -> bytes:
+    """
+    Return the bytes of an ICC profile, only re-reading the file once it has changed.
+    """
+    path = icc_profile_path.resolve()
+    return _read_icc_profile(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_rgb_to_cmyk_transform(
+    cmyk_profile_path: Path,
+    cmyk_mtime_ns: int,
+    rgb_profile_path: Path | None,
+    rgb_mtime_ns: int,
+    intent: ImageCms.Intent,
+) -> ImageCms.ImageCmsTransform:
+    """
+    Build an RGB to CMYK transform. Cached per profile paths, modification times and intent.
+    """
+    cmyk_profile = ImageCms.ImageCmsProfile(
+        BytesIO(_read_icc_profile(cmyk_profile_path, cmyk_mtime_ns))
+    )
+    rgb_profile = (
+        ImageCms.ImageCmsProfile(
+            BytesIO(_read_icc_profile(rgb_profile_path, rgb_mtime_ns))
+        )
+        if rgb_profile_path is not None
+        else ImageCms.createProfile("sRGB")
+    )
+    return ImageCms.buildTransform(
+        rgb_profile, cmyk_profile, "RGB", "CMYK", renderingIntent=intent
+    )
+
+
+def get_rgb_to_cmyk_transform(
+    cmyk_profile_path: Path,
+    rgb_profile_path: Path | None = None,
+    intent: ImageCms.Intent = ImageCms.Intent.PERCEPTUAL,
+) -> ImageCms.ImageCmsTransform:
+    """
+    Return a prebuilt ICC-managed RGB to CMYK transform, reused across pages and calls.
+
+    Parameters
+    ----------
+    cmyk_profile_path : pathlib.Path
+        Path to the destination (press) CMYK ICC profile.
+    rgb_profile_path : pathlib.Path, optional
+        Path to the source RGB ICC profile, sRGB if omitted.
+    intent : PIL.ImageCms.Intent, default PERCEPTUAL
+        Rendering intent of the transform.
+    """
+    cmyk_path = cmyk_profile_path.resolve()
+    rgb_path = rgb_profile_path.resolve() if rgb_profile_path is not None else None
+    return _build_rgb_to_cmyk_transform(
+        cmyk_path,
+        cmyk_path.stat().st_mtime_ns,
+        rgb_path,
+        rgb_path.stat().st_mtime_ns if rgb_path is not None else 0,
+        intent,
+    )
 
 
 def convert_pdf_to_cmyk_tiff_custom(
@@ -12,10 +86,15 @@ def convert_pdf_to_cmyk_tiff_custom(
     output_path: Path,
     resolution: int = 500,
     icc_profile_path: Path | None = None,
+    managed_rgb: bool = False,
+    rgb_profile_path: Path | None = None,
 ) -> None:
     """
     Convert a CMYK PDF to a multi‑page CMYK TIFF **without** going through an RGB stage.
 
+    For RGB-only PDFs, ``managed_rgb`` instead renders the page in RGB and
+    converts it to the press profile with a cached ``PIL.ImageCms`` transform.
+
     Parameters
     ----------
     pdf_path : pathlib.Path
@@ -26,9 +105,15 @@ def convert_pdf_to_cmyk_tiff_custom(
         DPI at which each page is rendered.
     icc_profile_path : pathlib.Path, optional
         Path to a CMYK ICC profile that will be embedded in the TIFF.
+    managed_rgb : bool, default False
+        Render in RGB and convert to ``icc_profile_path`` with an ICC-managed transform.
+    rgb_profile_path : pathlib.Path, optional
+        Source RGB ICC profile for ``managed_rgb``, sRGB if omitted.
     """
     if not pdf_path.is_file():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    if managed_rgb and not (icc_profile_path and icc_profile_path.is_file()):
+        raise ValueError("managed_rgb requires a CMYK icc_profile_path")
 
     # ------------------------------------------------------------------
     # 1. Open the PDF with PyMuPDF
@@ -43,18 +128,25 @@ def convert_pdf_to_cmyk_tiff_custom(
     page = doc[0]
     pix = page.get_pixmap(
         matrix=Matrix(resolution / 72, resolution / 72),
-        colorspace=csCMYK,
-    )
-    # Convert the raw CMYK data to a Pillow Image
-    img_cmyk = Image.frombytes(
-        "CMYK",
-        (pix.width, pix.height),
-        pix.samples,
-        "raw",
-        "CMYK",
-        0,
-        1,
+        colorspace=csRGB if managed_rgb else csCMYK,
     )
+    if managed_rgb and icc_profile_path:
+        # Convert through the cached RGB -> press CMYK transform
+        transform = get_rgb_to_cmyk_transform(icc_profile_path, rgb_profile_path)
+        img_cmyk = transform.apply(
+            Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        )
+    else:
+        # Convert the raw CMYK data to a Pillow Image
+        img_cmyk = Image.frombytes(
+            "CMYK",
+            (pix.width, pix.height),
+            pix.samples,
+            "raw",
+            "CMYK",
+            0,
+            1,
+        )
 
     doc.close()
     del page, pix, doc
@@ -69,17 +161,93 @@ def convert_pdf_to_cmyk_tiff_custom(
             "dpi": (resolution, resolution),
         }
         if icc_profile_path and icc_profile_path.is_file():
-            save_kwargs["icc_profile"] = icc_profile_path.read_bytes()
+            save_kwargs["icc_profile"] = load_icc_profile(icc_profile_path)
 
         img_cmyk.save(str(output_path), **save_kwargs)
     except Exception as exc:
         raise RuntimeError(f"Failed to write TIFF: {exc}") from exc
 
 
-def convert_pdf_to_cmyk_tiff_gs(pdf_path: Path, output_path: Path):
+class RenderVariant(TypedDict, total=True):
+    """
+    One raster output produced from a page by ``convert_pdf_to_variants``.
+    """
+
+    output_path: Path
+    resolution: int
+    colorspace: str
+
+
+_COLORSPACES = {"CMYK": csCMYK, "RGB": csRGB, "L": csGRAY}
+
+
+def convert_pdf_to_variants(
+    pdf_path: Path,
+    variants: list[RenderVariant],
+    icc_profile_path: Path | None = None,
+) -> None:
+    """
+    Render several outputs of a PDF page from a single parse of the page.
+
+    The page is interpreted once into a PyMuPDF display list, which is then
+    rasterised at each variant's resolution and colourspace, e.g. the press
+    CMYK TIFF, an RGB preview and a thumbnail in one call.
+
+    Parameters
+    ----------
+    pdf_path : pathlib.Path
+        Path to the input PDF.
+    variants : list[RenderVariant]
+        Outputs to produce. ``colorspace`` is one of ``"CMYK"``, ``"RGB"`` or
+        ``"L"``, the file format follows the ``output_path`` suffix.
+    icc_profile_path : pathlib.Path, optional
+        Path to a CMYK ICC profile that will be embedded in the CMYK outputs.
+    """
     if not pdf_path.is_file():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    for variant in variants:
+        if variant["colorspace"] not in _COLORSPACES:
+            raise ValueError(f"Unsupported colorspace: {variant['colorspace']}")
+
+    doc = fitzopen(str(pdf_path))
+    if doc.page_count == 0:
+        raise ValueError("PDF contains no pages")
+
+    # Interpret the page once - we assume there is only one page
+    display_list = doc[0].get_displaylist()
+    doc.close()
+
+    for variant in variants:
+        mode = variant["colorspace"]
+        resolution = variant["resolution"]
+        pix = display_list.get_pixmap(
+            matrix=Matrix(resolution / 72, resolution / 72),
+            colorspace=_COLORSPACES[mode],
+            alpha=False,
+        )
+        img = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+        del pix
 
+        output_path = variant["output_path"]
+        try:
+            save_kwargs: dict[str, object] = {"dpi": (resolution, resolution)}
+            if output_path.suffix.lower() in (".tif", ".tiff"):
+                save_kwargs["compression"] = "tiff_lzw"
+            if mode == "CMYK" and icc_profile_path and icc_profile_path.is_file():
+                save_kwargs["icc_profile"] = load_icc_profile(icc_profile_path)
+
+            img.save(str(output_path), **save_kwargs)
+        except Exception as exc:
+            raise RuntimeError(f"Failed to write {output_path}: {exc}") from exc
+
+    del display_list
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ghostscript() -> str:
+    """
+    Locate a working Ghostscript executable, probing it only once per process.
+    """
     gs_cmd = shutil.which("gs") or shutil.which("gswin64c")
     if not gs_cmd:
         raise EnvironmentError("Ghostscript is not installed or not in PATH")
@@ -89,6 +257,17 @@ def convert_pdf_to_cmyk_tiff_gs(pdf_path: Path, output_path: Path):
     if gs_check.returncode != 0:
         raise EnvironmentError("Ghostscript not working correctly")
 
+    return gs_cmd
+
+
+def convert_pdf_to_cmyk_tiff_gs(
+    pdf_path: Path, output_path: Path, resolution: int = 500
+) -> None:
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+    gs_cmd = _find_ghostscript()
+
     # Check available devices
     devices_check = run([gs_cmd, "-h"], capture_output=True, text=True)
     gs_device = "tiff32nc" if "tiff32nc" in devices_check.stdout else "tiffsep"
@@ -103,7 +282,7 @@ def convert_pdf_to_cmyk_tiff_gs(pdf_path: Path, output_path: Path):
         "-sCompression=lzw",
         "-sColorConversionStrategy=LeaveColorUnchanged",
         "-dUseCIEColor",
-        "-r500",  # <<< SET RESOLUTION HERE
+        f"-r{resolution}",
         "-dGraphicsAlphaBits=4",  # Improve pattern raster
         "-dTextAlphaBits=4",  # Improve text smoothing
         f"-sOutputFile={str(output_path)}",
@@ -111,3 +290,142 @@ def convert_pdf_to_cmyk_tiff_gs(pdf_path: Path, output_path: Path):
     ]
 
     _ = run(gs_command, capture_output=True, text=True)
+
+
+def stream_pdf_to_cmyk_gs(
+    pdf_path: Path,
+    sink: BinaryIO | Callable[[bytes], object],
+    resolution: int = 500,
+    device: str = "pam",
+    first_page_only: bool = False,
+    chunk_size: int = 1 << 20,
+) -> int:
+    """
+    Rasterise a PDF with Ghostscript writing to stdout, streaming the bytes into a sink.
+
+    Nothing touches the filesystem: Ghostscript writes to ``-sOutputFile=-`` and
+    the pipe is drained in chunks of ``chunk_size`` bytes into ``sink``.
+
+    Parameters
+    ----------
+    pdf_path : pathlib.Path
+        Path to the input PDF.
+    sink : BinaryIO or callable
+        Writable binary file object, or a callable taking each chunk of bytes.
+    resolution : int, default 500
+        DPI at which each page is rendered.
+    device : str, default "pam"
+        Ghostscript output device. ``pam`` emits uncompressed CMYK frames which
+        can be streamed, TIFF devices may need a seekable output.
+    first_page_only : bool, default False
+        Only render the first page of the PDF.
+    chunk_size : int, default 1 MiB
+        Number of bytes read from the pipe at a time.
+
+    Returns
+    -------
+    int
+        Number of bytes written to the sink.
+    """
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+    gs_cmd = _find_ghostscript()
+    write = sink if callable(sink) else sink.write
+
+    gs_command = [
+        gs_cmd,
+        "-q",
+        "-sstdout=%stderr",  # Keep stdout clean for the raster
+        "-dSAFER",
+        "-dBATCH",
+        "-dNOPAUSE",
+        "-dNOPROMPT",
+        f"-sDEVICE={device}",
+        "-sColorConversionStrategy=LeaveColorUnchanged",
+        "-dUseCIEColor",
+        f"-r{resolution}",
+        "-dGraphicsAlphaBits=4",  # Improve pattern raster
+        "-dTextAlphaBits=4",  # Improve text smoothing
+    ]
+    if first_page_only:
+        gs_command += ["-dFirstPage=1", "-dLastPage=1"]
+    gs_command += ["-sOutputFile=-", str(pdf_path)]
+
+    written = 0
+    errors: list[bytes] = []
+    with Popen(gs_command, stdout=PIPE, stderr=PIPE) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        # Drain stderr alongside stdout, so a chatty gs cannot fill the pipe and stall
+        drain = Thread(target=lambda: errors.append(proc.stderr.read()), daemon=True)
+        drain.start()
+        try:
+            while chunk := proc.stdout.read(chunk_size):
+                write(chunk)
+                written += len(chunk)
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.wait()
+            drain.join()
+
+    if proc.returncode != 0:
+        raise CalledProcessError(proc.returncode, gs_command, stderr=b"".join(errors))
+
+    return written
+
+
+def _parse_pam(data: bytes | bytearray) -> Image.Image:
+    """
+    Read the first CMYK frame of a PAM (P7) stream as a Pillow Image.
+    """
+    end = data.find(b"ENDHDR\n")
+    if not data.startswith(b"P7\n") or end < 0:
+        raise ValueError("Ghostscript output is not a PAM stream")
+
+    header: dict[str, str] = {}
+    for line in data[3:end].decode("ascii").splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.partition(" ")
+            header[key] = value.strip()
+
+    width, height = int(header["WIDTH"]), int(header["HEIGHT"])
+    if header.get("DEPTH") != "4" or header.get("MAXVAL") != "255":
+        raise ValueError(f"Unsupported PAM frame: {header}")
+
+    start = end + len(b"ENDHDR\n")
+    return Image.frombuffer(
+        "CMYK",
+        (width, height),
+        memoryview(data)[start : start + width * height * 4],
+        "raw",
+        "CMYK",
+        0,
+        1,
+    )
+
+
+def render_pdf_to_cmyk_image_gs(pdf_path: Path, resolution: int = 500) -> Image.Image:
+    """
+    Render the first page of a PDF to an in-memory CMYK Pillow Image via Ghostscript.
+
+    The raster is piped out of Ghostscript and never written to disk. Use
+    ``numpy.asarray`` on the result for a ``(height, width, 4)`` array.
+
+    Parameters
+    ----------
+    pdf_path : pathlib.Path
+        Path to the input PDF.
+    resolution : int, default 500
+        DPI at which the page is rendered.
+    """
+    buffer = bytearray()
+    stream_pdf_to_cmyk_gs(
+        pdf_path,
+        buffer.extend,
+        resolution=resolution,
+        device="pam",
+        first_page_only=True,
+    )
+    return _parse_pam(buffer)
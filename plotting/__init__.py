@@ -1,5 +1,15 @@
-from ._plotters import get_plotter
+from ._cache import cached_graph, graph_digest
+from ._plotters import get_graph_data, get_plotter
 from ._structs import Graph, Plot, PlotType
 from .pyplot import graph
 
-__all__ = ["get_plotter", "Graph", "Plot", "PlotType", "graph"]
+__all__ = [
+    "cached_graph",
+    "get_graph_data",
+    "get_plotter",
+    "graph_digest",
+    "Graph",
+    "Plot",
+    "PlotType",
+    "graph",
+]
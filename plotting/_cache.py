@@ -0,0 +1,84 @@
+import hashlib
+from enum import Enum
+from pathlib import Path
+
+import matplotlib
+from numpy import ascontiguousarray, ndarray
+
+from ._structs import Equation, Graph
+from .pyplot import graph
+
+RENDER_VERSION: str = f"1:{matplotlib.__version__}"
+"""
+Version of the renderer, bump the leading number whenever graph() output changes.
+"""
+
+
+def _feed(hasher: "hashlib._Hash", value: object) -> None:
+    """
+    Recursively feed a canonical, type-tagged encoding of a value into a hasher.
+    """
+    match value:
+        case ndarray():
+            arr = ascontiguousarray(value)
+            hasher.update(f"a{arr.dtype.str}{arr.shape}".encode())
+            hasher.update(arr.tobytes())
+        case dict():
+            hasher.update(f"d{len(value)}".encode())
+            for key in sorted(value):
+                _feed(hasher, key)
+                _feed(hasher, value[key])
+        case list() | tuple():
+            hasher.update(f"l{len(value)}".encode())
+            for item in value:
+                _feed(hasher, item)
+        case Enum():
+            _feed(hasher, f"{type(value).__name__}.{value.value}")
+        case Equation():
+            _feed(hasher, repr(value))
+        case str():
+            encoded = value.encode()
+            hasher.update(f"s{len(encoded)}:".encode())
+            hasher.update(encoded)
+        case _:
+            hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def graph_digest(graph: Graph) -> str:
+    """
+    Hash the full Graph spec (arrays, labels, styles, fontsize) and the renderer version.
+    """
+    hasher = hashlib.sha256(RENDER_VERSION.encode())
+    _feed(hasher, dict(graph))
+    return hasher.hexdigest()
+
+
+def _digest_path(graph_path: Path) -> Path:
+    """
+    Path of the sidecar file storing the digest of a rendered graph.
+    """
+    return graph_path.with_name(f"{graph_path.name}.sha256")
+
+
+def cached_graph(graph_obj: Graph, graph_path: Path) -> bool:
+    """
+    Render a graph only if its spec changed since the image at graph_path was saved.
+
+    The digest of the spec is stored next to the image, as ``<image>.sha256``.
+
+    Returns:
+    - True if the graph was rendered, False if the existing image was up to date.
+    """
+    digest = graph_digest(graph_obj)
+    digest_path = _digest_path(graph_path)
+
+    if (
+        graph_path.is_file()
+        and digest_path.is_file()
+        and digest_path.read_text().strip() == digest
+    ):
+        return False
+
+    graph(graph_obj, graph_path)
+    digest_path.write_text(digest)
+    return True
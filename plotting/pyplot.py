@@ -156,6 +156,7 @@ def graph(graph: Graph, graph_path: Path) -> None:
 
     # Save the rendered graph to the specified path
     plt.savefig(graph_path)
+    plt.close(fig)
 
 
 if __name__ == "__main__":
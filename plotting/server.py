@@ -0,0 +1,249 @@
+import argparse
+import json
+import multiprocessing
+import socketserver
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from os import cpu_count
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+from time import perf_counter_ns
+from typing import IO, Callable
+
+from .pyplot import _json_to_Graph, _load_json, _load_toml, graph
+
+Response = dict[str, object]
+
+
+def _warm() -> None:
+    """
+    Worker initializer: import matplotlib and load the font cache once per worker.
+    """
+    # stdout carries the responses, keep worker diagnostics off of it
+    sys.stdout = sys.stderr
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    fig, _ = plt.subplots()
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _ping() -> None:
+    """
+    No-op task, used to start the workers ahead of the first request.
+    """
+
+
+def _render(request: dict) -> float:
+    """
+    Render a single graph request inside a worker, returning the drawing time in ms.
+    """
+    start = perf_counter_ns()
+
+    spec = request.get("spec")
+    if spec is None:
+        spec_path = Path(request["spec_path"])
+        if spec_path.suffix == ".json":
+            spec = _load_json(spec_path)
+        else:
+            spec = _load_toml(spec_path)
+        if spec is None:
+            raise ValueError(f"Graph data could not be loaded from {spec_path}")
+
+    graph(_json_to_Graph(spec), Path(request["output"]))
+    return (perf_counter_ns() - start) / 1000000
+
+
+class RenderServer:
+    """
+    Keeps a bounded pool of warm render workers and feeds graph requests to them.
+
+    Each request is one JSON object per line, holding either an inline graph
+    ``spec`` (same schema as the TOML/JSON files of the CLI) or a ``spec_path``,
+    the ``output`` image path and an optional ``id``. One JSON response line is
+    produced per request, with ``ok``, ``error``, the drawing time ``render_ms``
+    and the end to end ``latency_ms``.
+    """
+
+    __slots__ = ("_lock", "_pool", "_slots", "_workers")
+    _lock: Lock
+    _pool: ProcessPoolExecutor
+    _slots: BoundedSemaphore
+    _workers: int
+
+    def __init__(self, workers: int = 1, backlog: int | None = None) -> None:
+        self._lock = Lock()
+        self._workers = workers
+        self._pool = self._start()
+        self._slots = BoundedSemaphore(backlog or workers * 2)
+
+    def _start(self) -> ProcessPoolExecutor:
+        """
+        Start a pool of freshly spawned workers and wait for them to be warm.
+
+        Workers are spawned rather than forked, so they never inherit the
+        server's threads and locks, and they are started up front so the first
+        requests do not pay for the worker start-up and matplotlib import.
+        """
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm,
+        )
+        for future in [pool.submit(_ping) for _ in range(self._workers)]:
+            future.result()
+        return pool
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """
+        Replace a broken pool, unless another thread already has.
+        """
+        with self._lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._start()
+
+    def submit(self, line: str, respond: Callable[[Response], None]) -> Future | None:
+        """
+        Queue one request line, blocking while the backlog of requests is full.
+
+        Returns a future resolved with the response once it has been sent, or
+        None if the line was rejected or the pool could not take it. A broken
+        pool is replaced, so later requests are served again.
+        """
+        received = perf_counter_ns()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict) or "output" not in request:
+                raise ValueError("request needs an 'output' path")
+        except ValueError as e:
+            respond({"id": None, "ok": False, "error": f"Bad request: {e}"})
+            return None
+
+        self._slots.acquire()
+        pool = self._pool
+        try:
+            future = pool.submit(_render, request)
+        except (BrokenProcessPool, RuntimeError) as e:
+            # Broken or shut down pool, the request never reached a worker
+            self._slots.release()
+            if isinstance(e, BrokenProcessPool):
+                self._restart(pool)
+            respond(
+                {
+                    "id": request.get("id"),
+                    "output": request["output"],
+                    "ok": False,
+                    "error": f"Render pool unavailable: {e}",
+                    "render_ms": None,
+                    "latency_ms": (perf_counter_ns() - received) / 1000000,
+                }
+            )
+            return None
+        completed: Future = Future()
+
+        def _done(fut: Future) -> None:
+            self._slots.release()
+            error = fut.exception()
+            if isinstance(error, BrokenProcessPool):
+                self._restart(pool)
+            response: Response = {
+                "id": request.get("id"),
+                "output": request["output"],
+                "ok": error is None,
+                "error": None if error is None else str(error),
+                "render_ms": fut.result() if error is None else None,
+                "latency_ms": (perf_counter_ns() - received) / 1000000,
+            }
+            try:
+                respond(response)
+            finally:
+                # Resolve even if the client has gone away and the write failed
+                completed.set_result(response)
+
+        future.add_done_callback(_done)
+        return completed
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+def _writer(stream: IO, binary: bool = False) -> Callable[[Response], None]:
+    """
+    Thread-safe writer of newline-delimited JSON responses.
+    """
+    lock = Lock()
+
+    def respond(response: Response) -> None:
+        payload = json.dumps(response) + "\n"
+        with lock:
+            stream.write(payload.encode() if binary else payload)
+            stream.flush()
+
+    return respond
+
+
+def serve_stdin(server: RenderServer) -> None:
+    """
+    Serve requests read from stdin, writing responses to stdout.
+    """
+    respond = _writer(sys.stdout)
+    for line in sys.stdin:
+        if line.strip():
+            server.submit(line, respond)
+
+
+def serve_socket(server: RenderServer, socket_path: Path) -> None:
+    """
+    Serve requests over a local Unix socket, one response line per request line.
+    """
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            respond = _writer(self.wfile, binary=True)
+            pending: list[Future] = []
+            for raw in self.rfile:
+                line = raw.decode()
+                if line.strip():
+                    future = server.submit(line, respond)
+                    if future is not None:
+                        pending.append(future)
+            wait(pending)
+
+    socket_path.unlink(missing_ok=True)
+    with socketserver.ThreadingUnixStreamServer(str(socket_path), _Handler) as unix:
+        try:
+            unix.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve graph render requests.")
+    parser.add_argument(
+        "--socket", type=str, default=None, help="Unix socket to listen on"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=cpu_count() or 1,
+        help="Number of render worker processes",
+    )
+    args = parser.parse_args()
+
+    server = RenderServer(workers=args.workers)
+    try:
+        if args.socket is None:
+            serve_stdin(server)
+        else:
+            serve_socket(server, Path(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
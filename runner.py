@@ -0,0 +1,199 @@
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from gc import collect
+from pathlib import Path
+from time import time_ns
+from typing import TypedDict
+
+from memory_profiler import memory_usage
+from numpy import array, float64
+
+from scheduling import CacheMode, Trial, prepare_cache
+
+Backend = Callable[[Path, Path], None]
+
+
+class TrialResult(TypedDict, total=True):
+    """
+    Metrics of a single trial, as reported back by a worker.
+    """
+
+    backend: str
+    index: int
+    warmup: bool
+    time_ms: float
+    memory_max: float
+    pid: int
+
+
+def output_path(images: Path, pdf: Path, backend: str) -> Path:
+    """
+    Path a backend writes its output for a PDF to.
+    """
+    return images / f"{pdf.name}_{backend.lower()}.png"
+
+
+def _timed(func: Backend, pdf: Path, output: Path) -> float:
+    """
+    Call a converter, returning only its own wall time in ms.
+    """
+    now = time_ns()
+    func(pdf, output)
+    return (time_ns() - now) / 1000000
+
+
+def _init_worker() -> None:
+    """
+    Worker initializer: fork, rather than spawn, the memory sampler processes.
+
+    Spawned samplers re-import the main module, and that start-up cost would
+    otherwise end up inside the measured trials.
+    """
+    multiprocessing.set_start_method("fork", force=True)
+
+
+def run_trial(
+    func: Backend, pdf: Path, output: Path, cache: CacheMode
+) -> tuple[float, float]:
+    """
+    Run one trial in the current process, returning its time (ms) and peak memory (MiB).
+
+    The time covers the converter call only, not the memory sampler around it.
+    Memory includes child processes, such as the ``gs`` process of the GS backend.
+    """
+    prepare_cache(pdf, cache)
+
+    mems, elapsed = memory_usage(
+        (_timed, (func, pdf, output), {}),
+        interval=0.25,
+        timeout=5,
+        include_children=True,
+        retval=True,
+    )
+
+    collect()
+    return elapsed, float(array(mems, dtype=float64).max())
+
+
+def _run_batch(
+    backends: Mapping[str, Backend],
+    pdf: Path,
+    images: Path,
+    trials: list[Trial],
+    cache: CacheMode,
+) -> list[TrialResult]:
+    """
+    Worker entry point: run a batch of trials and return their metrics.
+    """
+    results: list[TrialResult] = []
+    for trial in trials:
+        name = trial["backend"]
+        run_label = "Warmup" if trial["warmup"] else "Run"
+        print(
+            f"Processing {name} {pdf.name} @ {pdf} - {run_label} {trial['index'] + 1}"
+        )
+        time_ms, memory_max = run_trial(
+            backends[name], pdf, output_path(images, pdf, name), cache
+        )
+        results.append(
+            TrialResult(
+                backend=name,
+                index=trial["index"],
+                warmup=trial["warmup"],
+                time_ms=time_ms,
+                memory_max=memory_max,
+                pid=os.getpid(),
+            )
+        )
+    return results
+
+
+def _batches(trials: list[Trial], batch_size: int) -> list[list[Trial]]:
+    """
+    Cut the measured trials into batches, each preceded by its backends' warmups.
+    """
+    warmups = [trial for trial in trials if trial["warmup"]]
+    measured = [trial for trial in trials if not trial["warmup"]]
+
+    batches: list[list[Trial]] = []
+    for start in range(0, len(measured), batch_size):
+        batch = measured[start : start + batch_size]
+        names = {trial["backend"] for trial in batch}
+        batches.append(
+            [trial for trial in warmups if trial["backend"] in names] + batch
+        )
+    return batches
+
+
+def run_isolated(
+    schedules: Mapping[Path, list[Trial]],
+    backends: Mapping[str, Backend],
+    images: Path,
+    cache: CacheMode = CacheMode.HOT,
+    batch_size: int = 1,
+    workers: int = 1,
+) -> dict[Path, list[TrialResult]]:
+    """
+    Run scheduled trials in fresh worker processes from a recycling process pool.
+
+    The measured trials of every PDF are cut into batches of ``batch_size`` in
+    schedule order, and each batch runs in a freshly spawned interpreter which
+    exits afterwards, so heap fragmentation from one batch never leaks into the
+    memory readings of the next. Metrics are sent back over the pool's pipe.
+
+    As every worker starts cold, the warmup trials of the schedule are repeated
+    at the start of each batch, for the backends that batch measures. Their
+    cost is paid once per batch, so a larger ``batch_size`` amortises them.
+
+    Parameters
+    ----------
+    schedules : Mapping[pathlib.Path, list[Trial]]
+        Trial schedule for every PDF.
+    backends : Mapping[str, Callable]
+        Module level converter functions by backend name.
+    images : pathlib.Path
+        Directory the backends write their outputs to.
+    cache : CacheMode, default CacheMode.HOT
+        Page-cache state of the PDF at the start of each trial.
+    batch_size : int, default 1
+        Number of trials run by each worker before it is recycled.
+    workers : int, default 1
+        Number of concurrent workers. Batches of the same PDF always run one
+        after another, batches of different PDFs run in parallel when > 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    results: dict[Path, list[TrialResult]] = {pdf: [] for pdf in schedules}
+    batches: dict[Path, list[list[Trial]]] = {
+        pdf: _batches(trials, batch_size) for pdf, trials in schedules.items()
+    }
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        max_tasks_per_child=1,
+    ) as pool:
+        # Keep one batch in flight per PDF so its trials keep their order
+        running: dict[Future, Path] = {}
+
+        def _submit(pdf: Path) -> None:
+            if batches[pdf]:
+                batch = batches[pdf].pop(0)
+                future = pool.submit(_run_batch, backends, pdf, images, batch, cache)
+                running[future] = pdf
+
+        for pdf in batches:
+            _submit(pdf)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                pdf = running.pop(future)
+                results[pdf] += future.result()
+                _submit(pdf)
+
+    return results
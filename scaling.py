@@ -0,0 +1,125 @@
+from functools import partial
+from pathlib import Path
+from typing import Callable, cast
+
+from numpy import array, float64, median, ndarray
+
+from corpus import CorpusSpec, generate_corpus
+from methods import convert_pdf_to_cmyk_tiff_custom, convert_pdf_to_cmyk_tiff_gs
+from plotting import Graph, Plot, PlotType, cached_graph, get_graph_data
+from runner import run_trial
+from scheduling import CacheMode
+
+CWD: Path = Path(__file__).parent.resolve()
+GPATH: Path = CWD / "examples" / "scaling"
+GPATH.mkdir(parents=True, exist_ok=True)
+CORPUS = CWD / "corpus"
+CORPUS.mkdir(parents=True, exist_ok=True)
+IMAGES = CWD / "images"
+IMAGES.mkdir(parents=True, exist_ok=True)
+RUNS = 5
+
+BASELINE = CorpusSpec(pages=1, vector_ops=100, image_size=0)
+BASE_DPI = 150
+
+# axis name -> (values, expected growth)
+AXES: dict[str, tuple[list[int], PlotType]] = {
+    "pages": ([1, 2, 4, 8, 16], PlotType.LINEAR),
+    "vector_ops": ([100, 1000, 2500, 5000, 10000], PlotType.LINEAR),
+    "image_size": ([128, 256, 512, 1024, 2048], PlotType.EXPONENTIAL),
+    "dpi": ([75, 150, 300, 500, 600], PlotType.EXPONENTIAL),
+}
+
+BACKENDS: dict[str, Callable[..., None]] = {
+    "CUSTOM": convert_pdf_to_cmyk_tiff_custom,
+    "GS": convert_pdf_to_cmyk_tiff_gs,
+}
+
+# Backends which only render the first page, their page count curve is flat
+SINGLE_PAGE: set[str] = {"CUSTOM"}
+
+
+def measure(
+    func: Callable[..., None], pdf: Path, output: Path, dpi: int
+) -> tuple[float, float]:
+    """
+    Return the median time (ms) and peak memory (MiB) of RUNS calls of a converter.
+    """
+    times = ndarray(RUNS, order="C", dtype=float64)
+    memory_max = ndarray(RUNS, order="C", dtype=float64)
+
+    for index in range(RUNS):
+        times[index], memory_max[index] = run_trial(
+            partial(func, resolution=dpi), pdf, output, CacheMode.HOT
+        )
+
+    return float(median(times)), float(median(memory_max))
+
+
+for axis, (values, ptype) in AXES.items():
+    specs: list[CorpusSpec] = []
+    for value in values:
+        spec = CorpusSpec(**BASELINE)
+        if axis != "dpi":
+            spec[axis] = value  # type: ignore[literal-required]
+        specs.append(spec)
+
+    pdfs = generate_corpus(CORPUS, specs)
+    xaxis = array(values, order="C", dtype=float64)
+
+    names = [
+        name for name in BACKENDS if axis != "pages" or name not in SINGLE_PAGE
+    ]
+
+    times: dict[str, ndarray] = {}
+    memory: dict[str, ndarray] = {}
+    for name in names:
+        func = BACKENDS[name]
+        times[name] = ndarray(len(values), order="C", dtype=float64)
+        memory[name] = ndarray(len(values), order="C", dtype=float64)
+
+        for index, (value, pdf) in enumerate(zip(values, pdfs)):
+            dpi = value if axis == "dpi" else BASE_DPI
+            print(f"Scaling {name} {axis}={value} @ {pdf.name}")
+            times[name][index], memory[name][index] = measure(
+                func, pdf, IMAGES / f"{pdf.name}_{name.lower()}_scaling.tiff", dpi
+            )
+
+    for metric, results, unit in (
+        ("times", times, "Time (ms)"),
+        ("memory", memory, "Memory (MiB)"),
+    ):
+        plots = [
+            cast(
+                Plot,
+                {
+                    "label": f"{name} {metric}",
+                    "x": xaxis,
+                    "y": results[name].copy(order="C"),
+                    "type": ptype,
+                    "size": 20,
+                    "approximation": None,
+                },
+            )
+            for name in names
+        ]
+
+        for plot in plots:
+            fitted = get_graph_data(plot)
+            if fitted is not None:
+                print(f"{axis} {plot['label']}: {fitted['label']}")
+
+        cached_graph(
+            cast(
+                Graph,
+                {
+                    "name": f"scaling_{axis}_{metric}",
+                    "title": f"{metric.upper()} vs {axis.upper()}",
+                    "x_label": axis,
+                    "y_label": unit,
+                    "fontsize": 10,
+                    "plots": plots,
+                },
+            ),
+            GPATH / f"scaling_{axis}_{metric}.png",
+        )
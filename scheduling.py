@@ -0,0 +1,149 @@
+import os
+import random
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from pathlib import Path
+from typing import TypedDict
+
+
+class TrialOrder(Enum):
+    """
+    Order in which the trials of several backends are run.
+    """
+
+    SEQUENTIAL = "sequential"
+    INTERLEAVED = "interleaved"
+    RANDOM = "random"
+
+
+class CacheMode(Enum):
+    """
+    Page-cache state of the input file at the start of a trial.
+    """
+
+    HOT = "hot"
+    COLD = "cold"
+
+
+class Trial(TypedDict, total=True):
+    """
+    A single scheduled run of a backend.
+    """
+
+    backend: str
+    index: int
+    warmup: bool
+
+
+def schedule(
+    backends: Sequence[str],
+    runs: int,
+    order: TrialOrder = TrialOrder.INTERLEAVED,
+    warmup: int = 0,
+    seed: int | None = None,
+) -> list[Trial]:
+    """
+    Build the list of trials to run for the given backends.
+
+    Every backend gets ``warmup`` discarded trials followed by ``runs`` measured
+    trials. Warmup trials are always run first, in the same order as the
+    measured ones, so that no backend starts measuring on a cold interpreter.
+
+    Parameters
+    ----------
+    backends : Sequence[str]
+        Names of the backends to schedule.
+    runs : int
+        Number of measured trials per backend.
+    order : TrialOrder, default TrialOrder.INTERLEAVED
+        ``SEQUENTIAL`` runs all trials of one backend before the next,
+        ``INTERLEAVED`` alternates backends round-robin and ``RANDOM`` shuffles
+        the round-robin order within every round.
+    warmup : int, default 0
+        Number of discarded trials per backend.
+    seed : int, optional
+        Seed for the ``RANDOM`` order.
+    """
+    rng = random.Random(seed)
+
+    def _rounds(count: int, is_warmup: bool) -> list[Trial]:
+        if order is TrialOrder.SEQUENTIAL:
+            return [
+                Trial(backend=backend, index=index, warmup=is_warmup)
+                for backend in backends
+                for index in range(count)
+            ]
+
+        trials: list[Trial] = []
+        for index in range(count):
+            names = list(backends)
+            if order is TrialOrder.RANDOM:
+                rng.shuffle(names)
+            trials += [
+                Trial(backend=backend, index=index, warmup=is_warmup)
+                for backend in names
+            ]
+        return trials
+
+    return _rounds(warmup, True) + _rounds(runs, False)
+
+
+def pin_cpus(cpus: Iterable[int]) -> set[int]:
+    """
+    Pin the current process, and the children it spawns, to the given CPUs.
+
+    Returns the previous affinity so it can be restored. Raises EnvironmentError
+    if the platform does not support ``os.sched_setaffinity``, rather than
+    silently measuring an unpinned run.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        raise EnvironmentError(
+            "CPU pinning needs sched_setaffinity, which this platform lacks"
+        )
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, set(cpus))
+    return previous
+
+
+def evict_file(path: Path) -> bool:
+    """
+    Ask the kernel to drop the cached pages of a file with ``posix_fadvise(DONTNEED)``.
+
+    Returns False if the platform does not support ``posix_fadvise``.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def warm_file(path: Path, chunk_size: int = 1 << 20) -> None:
+    """
+    Read a file end to end so that its pages are resident in the page cache.
+    """
+    with open(path, "rb") as file:
+        while file.read(chunk_size):
+            pass
+
+
+def prepare_cache(path: Path, mode: CacheMode) -> None:
+    """
+    Bring the page-cache state of the input file in line with the cache mode.
+
+    Raises EnvironmentError for ``CacheMode.COLD`` if the file cannot be evicted,
+    rather than silently measuring a hot cache.
+    """
+    match mode:
+        case CacheMode.COLD:
+            if not evict_file(path):
+                raise EnvironmentError(
+                    "Cold-cache runs need posix_fadvise, which this platform lacks"
+                )
+        case CacheMode.HOT:
+            warm_file(path)
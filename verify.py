@@ -0,0 +1,319 @@
+import struct
+from collections.abc import Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, TypedDict
+
+from numpy import (
+    abs as npabs,
+    array_equal,
+    asarray,
+    concatenate,
+    count_nonzero,
+    einsum,
+    frombuffer,
+    inf,
+    int16,
+    int64,
+    log10,
+    maximum,
+    ndarray,
+    uint8,
+    zeros,
+)
+from PIL import Image
+
+# TIFF tag ids used by the strip reader
+_BITS_PER_SAMPLE = 258
+_COMPRESSION = 259
+_PHOTOMETRIC = 262
+_STRIP_OFFSETS = 273
+_SAMPLES_PER_PIXEL = 277
+_ROWS_PER_STRIP = 278
+_STRIP_BYTE_COUNTS = 279
+_PLANAR_CONFIGURATION = 284
+_PREDICTOR = 317
+
+
+class ChannelStats(TypedDict, total=True):
+    """
+    Difference statistics of a single image channel.
+    """
+
+    max_abs_error: int
+    differing: int
+    psnr: float
+
+
+class DiffReport(TypedDict, total=True):
+    """
+    Result of a strip-wise comparison between two TIFF images.
+    """
+
+    mode: str
+    size: tuple[int, int]
+    rows_compared: int
+    differing_pixels: int
+    channels: dict[str, ChannelStats]
+    stopped_early: bool
+    passed: bool
+
+
+def _strips_tiff(
+    strips: list[bytes],
+    tags: dict[int, tuple[int, ...]],
+    width: int,
+    rows_per_strip: int,
+    rows: int,
+) -> bytes:
+    """
+    Wrap the compressed bytes of a run of strips in a minimal standalone TIFF.
+
+    ``tags`` holds the layout tags (bits per sample, compression, photometric
+    interpretation, samples per pixel, predictor) copied from the source file.
+    """
+    entries: dict[int, tuple[int, tuple[int, ...]]] = {
+        256: (4, (width,)),
+        257: (4, (rows,)),
+        _BITS_PER_SAMPLE: (3, tags[_BITS_PER_SAMPLE]),
+        _COMPRESSION: (3, tags[_COMPRESSION]),
+        _PHOTOMETRIC: (3, tags[_PHOTOMETRIC]),
+        _STRIP_OFFSETS: (4, (0,) * len(strips)),
+        _SAMPLES_PER_PIXEL: (3, tags[_SAMPLES_PER_PIXEL]),
+        _ROWS_PER_STRIP: (4, (rows_per_strip,)),
+        _STRIP_BYTE_COUNTS: (4, tuple(len(strip) for strip in strips)),
+        _PLANAR_CONFIGURATION: (3, (1,)),
+        _PREDICTOR: (3, tags[_PREDICTOR]),
+    }
+
+    # Header, IFD, out of line tag values, then the strips themselves
+    extra_offset = 8 + 2 + 12 * len(entries) + 4
+    extra_size = sum(
+        len(values) * (2 if kind == 3 else 4)
+        for kind, values in entries.values()
+        if len(values) * (2 if kind == 3 else 4) > 4
+    )
+    data_offset = extra_offset + extra_size
+    offsets: list[int] = []
+    for strip in strips:
+        offsets.append(data_offset)
+        data_offset += len(strip)
+    entries[_STRIP_OFFSETS] = (4, tuple(offsets))
+
+    ifd = bytearray(struct.pack("<H", len(entries)))
+    extra = bytearray()
+    for tag, (kind, values) in sorted(entries.items()):
+        packed = struct.pack(f"<{len(values)}{'H' if kind == 3 else 'I'}", *values)
+        ifd += struct.pack("<HHI", tag, kind, len(values))
+        if len(packed) > 4:
+            ifd += struct.pack("<I", extra_offset + len(extra))
+            extra += packed
+        else:
+            ifd += packed.ljust(4, b"\x00")
+    ifd += struct.pack("<I", 0)
+
+    return b"".join([b"II*\x00", struct.pack("<I", 8), ifd, extra, *strips])
+
+
+def _decode_strips(
+    strips: list[bytes],
+    tags: dict[int, tuple[int, ...]],
+    width: int,
+    rows_per_strip: int,
+    rows: int,
+) -> ndarray:
+    """
+    Decode a run of strips to a single ``(rows, width, channels)`` array.
+
+    Compressed strips go through Pillow's libtiff decoder, so decompression and
+    predictor handling run in C.
+    """
+    channels = tags[_SAMPLES_PER_PIXEL][0]
+    if tags[_COMPRESSION][0] == 1:
+        data = b"".join(strips)
+        pixels = frombuffer(data, dtype=uint8, count=rows * width * channels)
+    else:
+        tiff = _strips_tiff(strips, tags, width, rows_per_strip, rows)
+        with Image.open(BytesIO(tiff)) as img:
+            pixels = asarray(img)
+    return pixels.reshape(rows, width, channels)
+
+
+def iter_tiff_strips(tiff_path: Path, min_rows: int = 256) -> Iterator[ndarray]:
+    """
+    Yield the first page of a striped 8-bit TIFF a run of strips at a time.
+
+    Consecutive strips are decoded together until they cover at least
+    ``min_rows`` rows, and each run is returned as a ``(rows, width, channels)``
+    uint8 array, so only one run of the image is held in memory at any point.
+
+    Parameters
+    ----------
+    tiff_path : pathlib.Path
+        Path to the TIFF to read.
+    min_rows : int, default 256
+        Minimum number of rows decoded at once.
+    """
+    if not tiff_path.is_file():
+        raise FileNotFoundError(f"TIFF not found: {tiff_path}")
+
+    with Image.open(tiff_path) as img:
+        tags = img.tag_v2
+        width, height = img.size
+        if _STRIP_OFFSETS not in tags:
+            raise ValueError("Only striped TIFFs can be streamed")
+        if tags.get(_PLANAR_CONFIGURATION, 1) != 1:
+            raise ValueError("Only contiguous (chunky) TIFFs can be streamed")
+        if any(bits != 8 for bits in tags.get(_BITS_PER_SAMPLE, (8,))):
+            raise ValueError("Only 8 bits per sample TIFFs can be streamed")
+
+        rows_per_strip = min(int(tags.get(_ROWS_PER_STRIP, height)), height)
+        offsets = tuple(tags[_STRIP_OFFSETS])
+        counts = tuple(tags[_STRIP_BYTE_COUNTS])
+        layout: dict[int, tuple[int, ...]] = {
+            _BITS_PER_SAMPLE: tuple(tags.get(_BITS_PER_SAMPLE, (8,))),
+            _COMPRESSION: (int(tags.get(_COMPRESSION, 1)),),
+            _PHOTOMETRIC: (int(tags[_PHOTOMETRIC]),),
+            _SAMPLES_PER_PIXEL: (
+                int(tags.get(_SAMPLES_PER_PIXEL, len(img.getbands()))),
+            ),
+            _PREDICTOR: (int(tags.get(_PREDICTOR, 1)),),
+        }
+
+    per_run = max(1, -(-min_rows // rows_per_strip))
+    fp: BinaryIO
+    with open(tiff_path, "rb") as fp:
+        for first in range(0, len(offsets), per_run):
+            rows = min(per_run * rows_per_strip, height - first * rows_per_strip)
+            if rows <= 0:
+                break
+
+            strips: list[bytes] = []
+            for offset, count in zip(
+                offsets[first : first + per_run], counts[first : first + per_run]
+            ):
+                fp.seek(offset)
+                strips.append(fp.read(count))
+            yield _decode_strips(strips, layout, width, rows_per_strip, rows)
+
+
+def _iter_bands(tiff_path: Path, band_rows: int) -> Iterator[ndarray]:
+    """
+    Regroup the strips of a TIFF into bands of ``band_rows`` rows.
+    """
+    pending: list[ndarray] = []
+    buffered = 0
+    for strip in iter_tiff_strips(tiff_path, band_rows):
+        pending.append(strip)
+        buffered += len(strip)
+        while buffered >= band_rows:
+            rows = concatenate(pending) if len(pending) > 1 else pending[0]
+            yield rows[:band_rows]
+            pending = [rows[band_rows:]]
+            buffered -= band_rows
+    if buffered:
+        yield concatenate(pending)
+
+
+def compare_tiffs(
+    reference_path: Path,
+    candidate_path: Path,
+    tolerance: int = 0,
+    max_abs_error: int | None = None,
+    max_differing: int | None = None,
+    band_rows: int = 256,
+) -> DiffReport:
+    """
+    Compare two TIFFs strip by strip and collect per-channel difference statistics.
+
+    Both files are streamed in parallel in bands of ``band_rows`` rows, so the
+    comparison runs in bounded memory no matter how large the rasters are.
+    Strip heights of the two files do not need to match.
+
+    Parameters
+    ----------
+    reference_path : pathlib.Path
+        TIFF produced by the trusted backend.
+    candidate_path : pathlib.Path
+        TIFF produced by the backend under test.
+    tolerance : int, default 0
+        Largest absolute sample difference still considered equal.
+    max_abs_error : int, optional
+        Stop early and fail once any channel differs by more than this.
+    max_differing : int, optional
+        Stop early and fail once more than this many pixels differ.
+    band_rows : int, default 256
+        Number of rows compared per vectorised step.
+
+    If neither ``max_abs_error`` nor ``max_differing`` is given, the comparison
+    only passes when no pixel differs by more than ``tolerance``.
+    """
+    with Image.open(reference_path) as ref, Image.open(candidate_path) as cand:
+        if ref.size != cand.size or ref.mode != cand.mode:
+            raise ValueError(
+                f"Cannot compare {ref.mode} {ref.size} against {cand.mode} {cand.size}"
+            )
+        mode = ref.mode
+        width, height = ref.size
+        bands = ref.getbands()
+
+    nchannels = len(bands)
+    max_err = zeros(nchannels, dtype=int16)
+    differing = zeros(nchannels, dtype=int64)
+    squared = zeros(nchannels, dtype=int64)
+    differing_pixels = 0
+    rows_compared = 0
+    stopped_early = False
+
+    for ref_band, cand_band in zip(
+        _iter_bands(reference_path, band_rows), _iter_bands(candidate_path, band_rows)
+    ):
+        count = len(ref_band)
+        if not array_equal(ref_band, cand_band):
+            # Only the pixels which changed contribute to the statistics
+            ref_px = ref_band.reshape(-1, nchannels)
+            cand_px = cand_band.reshape(-1, nchannels)
+            changed = (ref_px != cand_px).any(axis=1)
+            diff = npabs(ref_px[changed].astype(int16) - cand_px[changed].astype(int16))
+            over = diff > tolerance
+
+            max_err = maximum(max_err, diff.max(axis=0))
+            differing += count_nonzero(over, axis=0)
+            squared += einsum("ij,ij->j", diff, diff, dtype=int64)
+            differing_pixels += int(count_nonzero(over.any(axis=1)))
+        rows_compared += count
+
+        if (max_abs_error is not None and max_err.max() > max_abs_error) or (
+            max_differing is not None and differing_pixels > max_differing
+        ):
+            stopped_early = rows_compared < height
+            break
+
+    samples = rows_compared * width
+    channels: dict[str, ChannelStats] = {}
+    for index, band in enumerate(bands):
+        mse = int(squared[index]) / samples if samples else 0.0
+        channels[band] = ChannelStats(
+            max_abs_error=int(max_err[index]),
+            differing=int(differing[index]),
+            psnr=float(10 * log10(255**2 / mse)) if mse > 0 else inf,
+        )
+
+    if max_abs_error is None and max_differing is None:
+        # Without thresholds only an identical (within tolerance) image passes
+        passed = differing_pixels == 0
+    else:
+        passed = not (
+            (max_abs_error is not None and int(max_err.max()) > max_abs_error)
+            or (max_differing is not None and differing_pixels > max_differing)
+        )
+
+    return DiffReport(
+        mode=mode,
+        size=(width, height),
+        rows_compared=rows_compared,
+        differing_pixels=differing_pixels,
+        channels=channels,
+        stopped_early=stopped_early,
+        passed=passed,
+    )